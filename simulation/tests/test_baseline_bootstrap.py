@@ -0,0 +1,70 @@
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from validation import baseline_extract
+
+
+def _reference_bootstrap_ci(data: np.ndarray, samples: int, rng: np.random.Generator, ci: float):
+    """One resample per replicate, the textbook percentile bootstrap."""
+
+    means = np.array([data[rng.integers(0, data.size, size=data.size)].mean() for _ in range(samples)])
+    alpha = (1 - ci) / 2
+    return float(np.quantile(means, alpha)), float(np.quantile(means, 1 - alpha))
+
+
+class BootstrapMeanCiTest(unittest.TestCase):
+    """Batched bootstrap CIs agree with a per-replicate bootstrap and switch to the CLT at the threshold."""
+
+    def test_resample_means_matches_gather_and_mean(self) -> None:
+        rng = np.random.default_rng(3)
+        data = rng.normal(size=25)
+        idx = rng.integers(0, data.size, size=(baseline_extract.BOOTSTRAP_CHUNK, data.size), dtype=np.intp)
+        np.testing.assert_allclose(baseline_extract._resample_means(data, idx), data[idx].mean(axis=1))
+
+    def test_small_samples_match_reference_bootstrap(self) -> None:
+        data_rng = np.random.default_rng(11)
+        # Two samples share a size so the grouped path is exercised alongside a singleton group.
+        arrays = [data_rng.normal(size=30), data_rng.exponential(size=30), data_rng.normal(2.0, 0.5, size=17)]
+        samples = 4000
+        batched = baseline_extract.bootstrap_mean_cis(arrays, samples, np.random.default_rng(1), 0.95)
+        for data, (low, high) in zip(arrays, batched):
+            ref_low, ref_high = _reference_bootstrap_ci(data, samples, np.random.default_rng(2), 0.95)
+            half_width = (ref_high - ref_low) / 2
+            self.assertLess(low, data.mean())
+            self.assertGreater(high, data.mean())
+            self.assertAlmostEqual(low, ref_low, delta=0.1 * half_width)
+            self.assertAlmostEqual(high, ref_high, delta=0.1 * half_width)
+
+        scalar = baseline_extract.bootstrap_mean_ci(pd.Series(arrays[2]), samples, np.random.default_rng(1), 0.95)
+        self.assertAlmostEqual(scalar[0], batched[2][0], delta=0.1 * (batched[2][1] - batched[2][0]))
+        self.assertAlmostEqual(scalar[1], batched[2][1], delta=0.1 * (batched[2][1] - batched[2][0]))
+
+    def test_empty_sample_yields_nan(self) -> None:
+        low, high = baseline_extract.bootstrap_mean_ci(pd.Series([np.nan]), 100, np.random.default_rng(0), 0.95)
+        self.assertTrue(math.isnan(low) and math.isnan(high))
+
+    def test_normal_interval_from_threshold(self) -> None:
+        threshold = baseline_extract.BOOTSTRAP_NORMAL_THRESHOLD
+        data = np.random.default_rng(5).exponential(size=threshold)
+        rng = np.random.default_rng(9)
+        state = rng.bit_generator.state
+        (low, high), = baseline_extract.bootstrap_mean_cis([data], 500, rng, 0.95)
+
+        half_width = baseline_extract.scipy_norm_z(0.95) * data.std(ddof=1) / math.sqrt(threshold)
+        self.assertAlmostEqual(low, data.mean() - half_width, places=12)
+        self.assertAlmostEqual(high, data.mean() + half_width, places=12)
+        # The closed-form branch draws no resamples.
+        self.assertEqual(rng.bit_generator.state, state)
+
+        # One value below the threshold still bootstraps, and lands close to the normal interval.
+        (boot_low, boot_high), = baseline_extract.bootstrap_mean_cis([data[:-1]], 500, rng, 0.95)
+        self.assertNotEqual(rng.bit_generator.state, state)
+        self.assertAlmostEqual(boot_low, low, delta=0.15 * half_width)
+        self.assertAlmostEqual(boot_high, high, delta=0.15 * half_width)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from validation import checks
+
+
+class JsonReportTest(unittest.TestCase):
+    """The stdlib fallback writes the same document as the orjson path."""
+
+    def test_fallback_matches_orjson(self) -> None:
+        results = {
+            "stage": {"dev": {"mean": np.float64(1.5), "count": np.int64(3), "ok": np.bool_(True)}},
+            "drift": [float("nan"), float("inf"), 0.25],
+            "label": "arrival→dev µ",
+            2: "non-string key",
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fallback_path = os.path.join(tmpdir, "fallback.json")
+            with mock.patch.object(checks, "orjson", None):
+                checks.write_json_report(fallback_path, results)
+            with open(fallback_path, encoding="utf-8") as handle:
+                text = handle.read()
+            if checks.orjson is not None:
+                native_path = os.path.join(tmpdir, "native.json")
+                checks.write_json_report(native_path, results)
+                with open(native_path, encoding="utf-8") as handle:
+                    self.assertEqual(json.loads(text), json.load(handle))
+
+        self.assertNotIn("NaN", text)
+        self.assertNotIn("Infinity", text)
+        self.assertIn("arrival→dev µ", text)
+        payload = json.loads(text)
+        self.assertEqual(payload["drift"], [None, None, 0.25])
+        self.assertEqual(payload["stage"]["dev"], {"count": 3, "mean": 1.5, "ok": True})
+        self.assertEqual(payload["2"], "non-string key")
+
+
+if __name__ == "__main__":
+    unittest.main()
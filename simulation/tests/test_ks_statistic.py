@@ -0,0 +1,61 @@
+import math
+import unittest
+
+import numpy as np
+
+from validation import checks
+
+
+def _reference_ks(sample_a: np.ndarray, sample_b: np.ndarray) -> float:
+    """Merged-CDF two-sample KS statistic, evaluated at every pooled point."""
+
+    a_sorted = np.sort(sample_a)
+    b_sorted = np.sort(sample_b)
+    data = np.sort(np.concatenate([a_sorted, b_sorted]))
+    cdf_a = np.searchsorted(a_sorted, data, side="right") / a_sorted.size
+    cdf_b = np.searchsorted(b_sorted, data, side="right") / b_sorted.size
+    return float(np.max(np.abs(cdf_a - cdf_b)))
+
+
+class KsStatisticTest(unittest.TestCase):
+    """Both KS kernels agree with the merged-CDF definition, including ties and empty samples."""
+
+    def _kernels(self):
+        kernels = [("numpy", checks._ks_sorted_numpy), ("walk", checks._ks_sorted_walk)]
+        if checks.njit is not None:
+            kernels.append(("jit", checks._ks_sorted))
+        return kernels
+
+    def test_kernels_match_reference_with_ties(self) -> None:
+        rng = np.random.default_rng(7)
+        cases = [
+            (np.array([1.0, 1.0, 2.0, 3.0]), np.array([1.0, 2.0, 2.0, 2.0, 5.0])),
+            (np.array([0.0, 0.0, 0.0]), np.array([0.0, 0.0])),
+            (np.array([4.0]), np.array([1.0, 2.0, 3.0])),
+        ]
+        for _ in range(50):
+            cases.append(
+                (
+                    rng.integers(0, 6, size=rng.integers(1, 40)).astype(np.float64),
+                    rng.integers(0, 6, size=rng.integers(1, 40)).astype(np.float64),
+                )
+            )
+        for sample_a, sample_b in cases:
+            expected = _reference_ks(sample_a, sample_b)
+            a_sorted, b_sorted = np.sort(sample_a), np.sort(sample_b)
+            for label, kernel in self._kernels():
+                self.assertAlmostEqual(kernel(a_sorted, b_sorted), expected, places=12, msg=label)
+            self.assertAlmostEqual(checks._ks_statistic(sample_a, sample_b), expected, places=12)
+
+    def test_empty_sample_returns_nan(self) -> None:
+        empty = np.array([], dtype=np.float64)
+        values = np.array([1.0, 2.0, 2.0])
+        for sample_a, sample_b in [(empty, values), (values, empty), (empty, empty)]:
+            self.assertTrue(math.isnan(checks._ks_statistic(sample_a, sample_b)))
+            self.assertTrue(math.isnan(checks._ks_sorted_numpy(sample_a, sample_b)))
+            if checks.njit is not None:
+                self.assertTrue(math.isnan(checks._ks_sorted(sample_a, sample_b)))
+
+
+if __name__ == "__main__":
+    unittest.main()
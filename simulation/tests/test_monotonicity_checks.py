@@ -0,0 +1,49 @@
+import unittest
+from typing import Any, Dict
+
+from validation import checks
+
+
+def _scenario(name: str, summary: Dict[str, Any]) -> checks.ScenarioResult:
+    return checks.ScenarioResult(
+        name=name,
+        output_dir="",
+        summary_path="",
+        tickets_path="",
+        config_snapshot={},
+        summary_metrics=summary,
+        ticket_rows=[],
+    )
+
+
+class MonotonicityChecksTest(unittest.TestCase):
+    """NaN summary values fail the directionality checks; non-numeric ones are skipped."""
+
+    def test_nan_fails_and_non_numeric_is_skipped(self) -> None:
+        scenarios = {
+            "baseline": _scenario(
+                "baseline", {"avg_wait_dev": 1.0, "avg_wait_review": 2.0, "avg_wait_testing": 3.0}
+            ),
+            "arrival_high": _scenario(
+                "arrival_high", {"avg_wait_dev": 1.5, "avg_wait_review": float("nan"), "avg_wait_testing": "nan"}
+            ),
+        }
+        results = {r.name: r for r in checks.monotonicity_checks(scenarios)}
+
+        self.assertTrue(results["Monotonic arrival→avg_wait_dev"].passed)
+        self.assertFalse(results["Monotonic arrival→avg_wait_review"].passed)
+        self.assertEqual(results["Monotonic arrival→avg_wait_review"].details, "baseline=2.0, higher_arrival=nan")
+        self.assertNotIn("Monotonic arrival→avg_wait_testing", results)
+        # Metrics neither scenario reports produce no result.
+        self.assertNotIn("Monotonic arrival→mean_time_in_system", results)
+
+    def test_metric_missing_from_one_scenario_is_skipped(self) -> None:
+        scenarios = {
+            "baseline": _scenario("baseline", {"utilization_dev": 0.8}),
+            "capacity_high": _scenario("capacity_high", {}),
+        }
+        self.assertEqual(checks.monotonicity_checks(scenarios), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import math
+import os
+import tempfile
+import unittest
+
+from validation import checks
+
+
+class TicketLoadingTest(unittest.TestCase):
+    """Stray cells in numeric ticket columns are coerced without changing which tickets count as closed."""
+
+    def test_closed_time_keeps_any_recorded_value(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, checks.TICKETS_FILENAME)
+            with open(path, "w", encoding="utf-8", newline="") as handle:
+                handle.write("ticket_id,closed_time,total_wait\n1,5.0,1.5\n2,,oops\n3,closed,2.0\n")
+            frame = checks.load_ticket_frame(path)
+
+        self.assertTrue(math.isnan(frame["total_wait"][1]))
+        self.assertEqual(frame["closed_time"].tolist()[2], "closed")
+        for tickets in (frame, checks.ticket_records(frame)):
+            self.assertEqual(checks.TicketArrays.from_rows(tickets).closed_mask.tolist(), [True, False, True])
+
+    def test_integer_column_with_blanks_keeps_ints(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, checks.TICKETS_FILENAME)
+            with open(path, "w", encoding="utf-8", newline="") as handle:
+                handle.write("ticket_id,service_completions_dev,total_wait\n1,0,1.5\n2,,2.0\n3,2,0.5\n")
+            frame = checks.load_ticket_frame(path)
+            rows = checks.load_ticket_rows(path)
+
+        values = [row["service_completions_dev"] for row in rows]
+        self.assertEqual(values, [0, None, 2])
+        self.assertIsInstance(values[0], int)
+        for tickets in (frame, rows):
+            column = checks.TicketArrays.from_rows(tickets).column("service_completions_dev")
+            self.assertEqual(column[[0, 2]].tolist(), [0.0, 2.0])
+            self.assertTrue(math.isnan(column[1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,14 +3,17 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import hashlib
 import json
 import logging
+import os
 import shutil
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, Sequence, Tuple
 
 import yaml
 
@@ -209,7 +212,9 @@ def _persist_config_snapshot(config_path: Path) -> Dict[str, Any]:
     return snapshot
 
 
-def _run_single_scenario(base_dir: Path, scenario: Dict[str, Any], baseline_metrics: Dict[str, Any]) -> checks.ScenarioResult:
+def _simulate_scenario(base_dir: Path, scenario: Dict[str, Any]) -> Tuple[Path, Path, Path, Dict[str, Any], float]:
+    # Overrides mutate the shared simulation config and simulate.main() writes to a shared
+    # output directory, so this step always runs on the main thread, one scenario at a time.
     scenario_dir = base_dir / scenario["id"]
     logging.info("Running scenario %s", scenario["id"])
     applied = apply_config_overrides(scenario.get("overrides", {}))
@@ -218,12 +223,23 @@ def _run_single_scenario(base_dir: Path, scenario: Dict[str, Any], baseline_metr
     simulate.main()
     summary_path, tickets_path = _copy_outputs(scenario_dir)
     config_snapshot = _persist_config_snapshot(scenario_dir / "config_used.json")
+    return scenario_dir, summary_path, tickets_path, config_snapshot, sim_config.SIM_DURATION
+
+
+def _check_scenario(
+    scenario: Dict[str, Any],
+    outputs: Tuple[Path, Path, Path, Dict[str, Any], float],
+    baseline_metrics: Dict[str, Any],
+) -> checks.ScenarioResult:
+    # Only reads the scenario's own copied outputs, so it is safe to run on a worker thread.
+    scenario_dir, summary_path, tickets_path, config_snapshot, sim_duration = outputs
     summary_metrics = checks.load_summary_metrics(str(summary_path))
-    tickets = checks.load_ticket_rows(str(tickets_path))
+    ticket_frame = checks.load_ticket_frame(str(tickets_path))
+    ticket_arrays = checks.TicketArrays.from_rows(ticket_frame)
 
     check_results: List[checks.CheckResult] = []
     check_results.extend(checks.check_boundedness(summary_metrics))
-    check_results.extend(checks.check_conservation(summary_metrics, tickets, sim_config.SIM_DURATION))
+    check_results.extend(checks.check_conservation(summary_metrics, ticket_arrays, sim_duration))
     if baseline_metrics and scenario.get("id") == "baseline":
         check_results.extend(
             checks.check_baseline(
@@ -231,18 +247,10 @@ def _run_single_scenario(base_dir: Path, scenario: Dict[str, Any], baseline_metr
                 baseline_metrics,
                 rel_tol=0.1,
                 abs_tol=1e-6,
-                ticket_rows=tickets,
+                ticket_rows=ticket_arrays,
             )
         )
 
-    verification_report = None
-    try:
-        verify_exit = verify_main(["--input", str(scenario_dir)])
-        logging.info("Verification exit code for %s: %s", scenario["id"], verify_exit)
-        verification_report = str(Path(scenario_dir) / "verification_report.md")
-    except SystemExit as exc:  # pragma: no cover - defensive
-        logging.error("Verification terminated with %s", exc)
-
     return checks.ScenarioResult(
         name=scenario["id"],
         output_dir=str(scenario_dir),
@@ -250,12 +258,30 @@ def _run_single_scenario(base_dir: Path, scenario: Dict[str, Any], baseline_metr
         tickets_path=str(tickets_path),
         config_snapshot=config_snapshot,
         summary_metrics=summary_metrics,
-        ticket_rows=tickets,
-        verification_report=verification_report,
+        ticket_rows=[],
         checks=check_results,
+        ticket_arrays=ticket_arrays,
     )
 
 
+def _verify_scenario(scenario: Dict[str, Any], scenario_dir: Path) -> str | None:
+    # verify_main prints to stdout, so it runs on the main thread to keep each scenario's output together.
+    try:
+        verify_exit = verify_main(["--input", str(scenario_dir)])
+        logging.info("Verification exit code for %s: %s", scenario["id"], verify_exit)
+        return str(Path(scenario_dir) / "verification_report.md")
+    except SystemExit as exc:  # pragma: no cover - defensive
+        logging.error("Verification terminated with %s", exc)
+        return None
+
+
+def _log_check_failure(scenario_id: str, future: Future[checks.ScenarioResult]) -> None:
+    # Runs as soon as the checks finish, so a failure is logged while later scenarios still simulate.
+    exc = future.exception()
+    if exc is not None:
+        logging.error("Scenario %s failed: %s", scenario_id, exc, exc_info=exc)
+
+
 def _render_markdown(
     base_dir: Path,
     scenario_results: List[checks.ScenarioResult],
@@ -272,8 +298,8 @@ def _render_markdown(
         return str(value)
 
     def _observed_metric(result: checks.ScenarioResult, metric: str) -> Any:
-        if metric in {"mean_total_wait", "mean_time_in_system"} and result.ticket_rows:
-            ticket_means = checks.aggregate_ticket_means(result.ticket_rows)
+        if metric in {"mean_total_wait", "mean_time_in_system"} and len(result.tickets):
+            ticket_means = checks.aggregate_ticket_means(result.tickets)
             if metric in ticket_means:
                 return ticket_means[metric]
         return result.summary_metrics.get(metric)
@@ -370,23 +396,46 @@ def main(argv: List[str] | None = None) -> int:
     scenarios = _scenario_overrides(args.seed, baseline_metrics)
 
     results: List[checks.ScenarioResult] = []
-    for scenario in scenarios:
-        try:
-            result = _run_single_scenario(run_dir, scenario, baseline_metrics)
-            results.append(result)
-        except Exception as exc:  # noqa: BLE001
-            logging.exception("Scenario %s failed: %s", scenario["id"], exc)
-            failed_result = checks.ScenarioResult(
-                name=scenario["id"],
-                output_dir=str(run_dir / scenario["id"]),
-                summary_path="",
-                tickets_path="",
-                config_snapshot={},
-                summary_metrics={},
-                ticket_rows=[],
-                checks=[checks.CheckResult("Execution", False, str(exc))],
+    pending: List[
+        Tuple[Dict[str, Any], Future[checks.ScenarioResult] | None, str | None, Exception | None]
+    ] = []
+    # Simulations and verification run back to back on the main thread; each scenario's
+    # checks overlap with them on the pool. Results are collected in scenario order.
+    with ThreadPoolExecutor(max_workers=max(1, min(os.cpu_count() or 1, len(scenarios)))) as ex:
+        for scenario in scenarios:
+            try:
+                outputs = _simulate_scenario(run_dir, scenario)
+                future = ex.submit(_check_scenario, scenario, outputs, baseline_metrics)
+                future.add_done_callback(functools.partial(_log_check_failure, scenario["id"]))
+                verification_report = _verify_scenario(scenario, outputs[0])
+            except Exception as exc:  # noqa: BLE001
+                logging.exception("Scenario %s failed: %s", scenario["id"], exc)
+                pending.append((scenario, None, None, exc))
+                continue
+            pending.append((scenario, future, verification_report, None))
+
+        for scenario, future, verification_report, error in pending:
+            if future is not None:
+                try:
+                    result = future.result()
+                except Exception as exc:  # noqa: BLE001 - already logged by _log_check_failure
+                    error = exc
+                else:
+                    result.verification_report = verification_report
+                    results.append(result)
+                    continue
+            results.append(
+                checks.ScenarioResult(
+                    name=scenario["id"],
+                    output_dir=str(run_dir / scenario["id"]),
+                    summary_path="",
+                    tickets_path="",
+                    config_snapshot={},
+                    summary_metrics={},
+                    ticket_rows=[],
+                    checks=[checks.CheckResult("Execution", False, str(error))],
+                )
             )
-            results.append(failed_result)
 
     scenario_map = {res.name: res for res in results}
     monotonic_results = checks.monotonicity_checks(scenario_map)
@@ -445,12 +494,12 @@ def main(argv: List[str] | None = None) -> int:
                 "summary_path": res.summary_path,
                 "tickets_path": res.tickets_path,
                 "config_snapshot": res.config_snapshot,
-                "checks": [check.__dict__ for check in (res.checks or [])],
+                "checks": [check.to_dict() for check in (res.checks or [])],
             }
             for res in results
         ],
-        "monotonicity": [check.__dict__ for check in monotonic_results],
-        "plausibility_checks": [check.__dict__ for check in plausibility_results],
+        "monotonicity": [check.to_dict() for check in monotonic_results],
+        "plausibility_checks": [check.to_dict() for check in plausibility_results],
         "plausibility_stats": plausibility_stats,
     }
     checks.write_json_report(str(run_dir / RESULTS_JSON), payload)
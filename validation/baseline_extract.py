@@ -11,17 +11,43 @@ captures a snapshot of the current simulator configuration for reproducibility.
 from __future__ import annotations
 
 import argparse
+import csv
+from concurrent.futures import ThreadPoolExecutor
 import dataclasses
+import functools
 import hashlib
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 import sys
 
 import numpy as np
 import pandas as pd
 import yaml
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+try:
+    from numba import njit, prange
+except ModuleNotFoundError:  # pragma: no cover - optional dependency fallback
+    njit = None  # type: ignore[assignment]
+
+try:
+    from scipy.stats import norm as _scipy_norm
+except ModuleNotFoundError:  # pragma: no cover - optional dependency fallback
+    _scipy_norm = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency fallback
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ModuleNotFoundError:  # pragma: no cover - optional dependency fallback
+    pa = None  # type: ignore[assignment]
+    pacsv = None  # type: ignore[assignment]
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
@@ -86,36 +112,138 @@ class BaselineConfig:
         return cls(**merged)
 
 
+# Read size for the pre-3.11 hashing fallback.
+HASH_BLOCK_SIZE = 1 << 20
+
+
 def sha256sum(path: Path) -> str:
-    h = hashlib.sha256()
     with open(path, "rb") as fh:
-        for chunk in iter(lambda: fh.read(8192), b""):
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(fh, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: fh.read(HASH_BLOCK_SIZE), b""):
             h.update(chunk)
     return h.hexdigest()
 
 
-def bootstrap_mean_ci(series: pd.Series, samples: int, seed: int, ci: float) -> Tuple[float, float]:
-    data = series.dropna().to_numpy()
-    if len(data) == 0:
-        return float("nan"), float("nan")
-    rng = np.random.default_rng(seed)
-    draws = rng.choice(data, size=(samples, len(data)), replace=True).mean(axis=1)
+def sha256_many(paths: List[Path]) -> Dict[str, str]:
+    """Hash several files concurrently; hashlib releases the GIL on large buffers."""
+
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+        digests = list(ex.map(sha256sum, paths))
+    return {path.name: digest for path, digest in zip(paths, digests)}
+
+
+# Textual spellings accepted as a positive rework flag.
+_TRUE_FLAG_VALUES = frozenset({"true", "1", "yes", "y", "1.0"})
+
+# Bootstrap replicates resampled per block; keeps the index matrix small enough
+# to stay cache-resident instead of materializing (samples x N) floats at once.
+BOOTSTRAP_CHUNK = 64
+
+# Sample size from which the bootstrap mean CI is replaced by the CLT interval
+# mean +/- z * sd / sqrt(n); at this size the two agree to well within the
+# bootstrap's own Monte Carlo noise, and no resampling is needed.
+BOOTSTRAP_NORMAL_THRESHOLD = 5000
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _resample_means(data: np.ndarray, idx: np.ndarray) -> np.ndarray:
+        """Gather-and-mean each row of ``idx`` in parallel over replicates."""
+
+        reps, n = idx.shape
+        out = np.empty(reps, dtype=np.float64)
+        for b in prange(reps):
+            total = 0.0
+            for i in range(n):
+                total += data[idx[b, i]]
+            out[b] = total / n
+        return out
+
+else:
+
+    def _resample_means(data: np.ndarray, idx: np.ndarray) -> np.ndarray:
+        """Gather-and-mean each row of ``idx`` (NumPy fallback without Numba)."""
+
+        return data.take(idx).mean(axis=1)
+
+
+def bootstrap_mean_cis(
+    arrays: List[np.ndarray],
+    samples: int,
+    rng: np.random.Generator,
+    ci: float,
+) -> List[Tuple[float, float]]:
+    """Bootstrap mean CIs for several samples in one pass.
+
+    Samples of equal size share each block of resample indices, so the RNG
+    runs once per size group and the CI endpoints of a group come from a
+    single quantile call. Samples of at least ``BOOTSTRAP_NORMAL_THRESHOLD``
+    values use the closed-form normal interval instead. Empty samples yield
+    ``(nan, nan)``.
+    """
+
+    results: List[Tuple[float, float]] = [(float("nan"), float("nan"))] * len(arrays)
+    groups: Dict[int, List[int]] = {}
+    for pos, data in enumerate(arrays):
+        n = len(data)
+        if n >= BOOTSTRAP_NORMAL_THRESHOLD:
+            mean = float(data.mean())
+            half_width = scipy_norm_z(ci) * float(data.std(ddof=1)) / n ** 0.5
+            results[pos] = (mean - half_width, mean + half_width)
+        elif n:
+            groups.setdefault(n, []).append(pos)
+
     alpha = (1 - ci) / 2
-    lower = float(np.quantile(draws, alpha))
-    upper = float(np.quantile(draws, 1 - alpha))
-    return lower, upper
+    for n, members in groups.items():
+        stacked = np.stack([arrays[pos] for pos in members])
+        draws = np.empty((len(members), samples), dtype=np.float64)
+        for start in range(0, samples, BOOTSTRAP_CHUNK):
+            stop = min(start + BOOTSTRAP_CHUNK, samples)
+            idx = rng.integers(0, n, size=(stop - start, n), dtype=np.intp)
+            for row, data in enumerate(stacked):
+                draws[row, start:stop] = _resample_means(data, idx)
+        bounds = np.quantile(draws, [alpha, 1 - alpha], axis=1)
+        for row, pos in enumerate(members):
+            results[pos] = (float(bounds[0, row]), float(bounds[1, row]))
+    return results
+
+
+def bootstrap_mean_ci(series: pd.Series, samples: int, rng: np.random.Generator, ci: float) -> Tuple[float, float]:
+    data = series.dropna().to_numpy(dtype=np.float64)
+    return bootstrap_mean_cis([data], samples, rng, ci)[0]
+
 
+# pandas >= 2.0 accepts format="ISO8601", which skips per-element format
+# inference; older versions fall back to the generic parser.
+_TIMESTAMP_FORMAT_KW: Dict[str, str] = {"format": "ISO8601"} if int(pd.__version__.split(".")[0]) >= 2 else {}
+
+
+def parse_timestamps(values: pd.Series) -> pd.Series:
+    """Parse Jira/GitHub timestamps to UTC, coercing invalid entries to NaT."""
+
+    return pd.to_datetime(values, errors="coerce", utc=True, **_TIMESTAMP_FORMAT_KW)
+
+
+def safe_window(
+    created_dt: pd.Series,
+    resolved_dt: pd.Series,
+    override: Tuple[str, str] | None,
+) -> Tuple[datetime, datetime]:
+    """Observation window from already-parsed timestamp series (NaT is skipped)."""
 
-def safe_window(created: pd.Series, resolved: pd.Series, override: Tuple[str, str] | None) -> Tuple[datetime, datetime]:
     if override:
         return pd.to_datetime(override[0]).to_pydatetime(), pd.to_datetime(override[1]).to_pydatetime()
-    created_dt = pd.to_datetime(created, errors="coerce", utc=True).dropna()
-    resolved_dt = pd.to_datetime(resolved, errors="coerce", utc=True).dropna()
-    if created_dt.empty:
+    created_min, created_max = created_dt.min(), created_dt.max()
+    if pd.isna(created_min):
         raise ValueError("No valid created timestamps found in input CSV")
-    window_start = created_dt.min().to_pydatetime()
-    window_end = max(created_dt.max(), resolved_dt.max() if not resolved_dt.empty else created_dt.max()).to_pydatetime()
-    return window_start, window_end
+    resolved_max = resolved_dt.max()
+    window_end = created_max if pd.isna(resolved_max) else max(created_max, resolved_max)
+    return created_min.to_pydatetime(), window_end.to_pydatetime()
 
 
 def rate_confidence_interval(count: int, denom: int, ci: float) -> Tuple[float, float]:
@@ -125,7 +253,7 @@ def rate_confidence_interval(count: int, denom: int, ci: float) -> Tuple[float,
     if count == 0 or count == denom:
         return p, p
     se = (p * (1 - p) / denom) ** 0.5
-    z = 1.96 if abs(ci - 0.95) < 1e-9 else scipy_norm_z(ci)
+    z = scipy_norm_z(ci)
     return p - z * se, p + z * se
 
 
@@ -135,16 +263,84 @@ def poisson_rate_ci(count: int, window_days: float, ci: float) -> Tuple[float, f
     if count == 0:
         return 0.0, 0.0
     se = (count ** 0.5) / window_days
-    z = 1.96 if abs(ci - 0.95) < 1e-9 else scipy_norm_z(ci)
+    z = scipy_norm_z(ci)
     rate = count / window_days
     return rate - z * se, rate + z * se
 
 
+# Two-sided 95% normal critical value, norm.ppf(0.975).
+_Z_95 = 1.959963984540054
+
+
+@functools.lru_cache(maxsize=None)
 def scipy_norm_z(ci: float) -> float:
-    from scipy.stats import norm  # localized import to avoid top-level dependency in environments without SciPy
+    """Two-sided normal critical value for ``ci``, computed once per level."""
 
+    if abs(ci - 0.95) < 1e-9:
+        return _Z_95
+    if _scipy_norm is None:
+        raise ModuleNotFoundError("SciPy is required for ci_level values other than 0.95")
     alpha = 1 - ci
-    return float(norm.ppf(1 - alpha / 2))
+    return float(_scipy_norm.ppf(1 - alpha / 2))
+
+
+def _input_columns(cfg: BaselineConfig) -> set[str]:
+    """Columns of the merged ETL CSV that the baseline metrics actually consume."""
+
+    return {
+        "fields.created",
+        "created",
+        "fields.resolutiondate",
+        "resolved",
+        "resolution_time_days",
+        *cfg.stage_columns.values(),
+        *cfg.rework_flags.values(),
+    }
+
+
+def _load_input_arrow(path: Path, needed: set[str], numeric: set[str]) -> pd.DataFrame:
+    """Read the required columns with pyarrow's multithreaded CSV parser."""
+
+    with open(path, "r", encoding="utf-8", newline="") as fh:
+        header = next(csv.reader(fh), [])
+    include = [col for col in header if col in needed]
+    table = pacsv.read_csv(
+        path,
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=include,
+            column_types={col: pa.float64() for col in include if col in numeric},
+        ),
+    )
+    return table.to_pandas()
+
+
+def _load_input_pandas(path: Path, needed: set[str], dtype: Dict[str, str] | None) -> pd.DataFrame:
+    return pd.read_csv(path, usecols=lambda col: col in needed, dtype=dtype)
+
+
+def load_input(cfg: BaselineConfig) -> pd.DataFrame:
+    """Load only the required columns of the merged CSV.
+
+    The ETL output is wide (free-text Jira/GitHub fields); only the consumed
+    columns are materialized, so memory scales with those columns rather than
+    the file width. pyarrow is used when installed, pandas otherwise.
+    """
+
+    needed = _input_columns(cfg)
+    # Durations are pinned to float64 so no dtype inference runs on them.
+    numeric = {*cfg.stage_columns.values(), "resolution_time_days"}
+    if pacsv is not None:
+        try:
+            return _load_input_arrow(cfg.input_csv, needed, numeric)
+        except ValueError:
+            # ArrowInvalid (a ValueError) on type conflicts; pandas is more lenient.
+            pass
+    try:
+        return _load_input_pandas(cfg.input_csv, needed, {col: "float64" for col in numeric})
+    except ValueError:
+        # Non-numeric duration cells: read as inferred and let pd.to_numeric coerce them.
+        return _load_input_pandas(cfg.input_csv, needed, None)
 
 
 def compute_arrival_and_closure(df: pd.DataFrame, cfg: BaselineConfig) -> Dict[str, Any]:
@@ -160,13 +356,14 @@ def compute_arrival_and_closure(df: pd.DataFrame, cfg: BaselineConfig) -> Dict[s
     else:
         resolved = df.get("resolved", pd.Series([], dtype="datetime64[ns]"))
 
-    window_start, window_end = safe_window(created, resolved, cfg.window_override)
+    created_dt = parse_timestamps(created)
+    resolved_dt = parse_timestamps(resolved)
+
+    window_start, window_end = safe_window(created_dt, resolved_dt, cfg.window_override)
     window_days = max((window_end - window_start).total_seconds() / 86400.0, 1e-9)
 
-    created_dt = pd.to_datetime(created, errors="coerce", utc=True).dropna()
-    resolved_dt = pd.to_datetime(resolved, errors="coerce", utc=True).dropna()
-    arrivals = len(created_dt)
-    closures = len(resolved_dt)
+    arrivals = int(created_dt.notna().sum())
+    closures = int(resolved_dt.notna().sum())
 
     arrival_rate = arrivals / window_days
     closure_rate = closures / arrivals if arrivals else float("nan")
@@ -188,20 +385,53 @@ def compute_arrival_and_closure(df: pd.DataFrame, cfg: BaselineConfig) -> Dict[s
     }
 
 
-def compute_stage_summaries(df: pd.DataFrame, cfg: BaselineConfig, window_days: float) -> Dict[str, Dict[str, Any]]:
+def rework_flags_to_bool(flag_series: pd.Series) -> np.ndarray:
+    """Interpret a rework proxy column as a boolean array (missing -> False)."""
+
+    if is_bool_dtype(flag_series):
+        return flag_series.to_numpy(dtype=bool, na_value=False)
+    if is_numeric_dtype(flag_series):
+        return flag_series.to_numpy(dtype=np.float64, na_value=np.nan) == 1
+    return flag_series.astype("string").str.lower().isin(_TRUE_FLAG_VALUES).to_numpy(dtype=bool)
+
+
+def compute_stage_summaries(
+    df: pd.DataFrame,
+    cfg: BaselineConfig,
+    window_days: float,
+    rng: np.random.Generator,
+) -> Dict[str, Dict[str, Any]]:
+    present = {stage: column for stage, column in cfg.stage_columns.items() if column in df.columns}
+    values = (
+        df[list(present.values())]
+        .apply(pd.to_numeric, errors="coerce")
+        .to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    )
+    values[values < 0] = np.nan
+    counts = np.count_nonzero(~np.isnan(values), axis=0)
+    keep = counts > 0
+    stages = [stage for stage, kept in zip(present, keep) if kept]
+    values = values[:, keep]
+    counts = counts[keep]
+    if not stages:
+        return {}
+
+    means = np.nanmean(values, axis=0)
+    medians, p95s = np.nanquantile(values, [0.5, 0.95], axis=0)
+    mean_cis = bootstrap_mean_cis(
+        [col[~np.isnan(col)] for col in values.T],
+        cfg.bootstrap_samples,
+        rng,
+        cfg.ci_level,
+    )
+
     summaries: Dict[str, Dict[str, Any]] = {}
-    for stage, column in cfg.stage_columns.items():
-        if column not in df.columns:
-            continue
-        series = pd.to_numeric(df[column], errors="coerce").dropna()
-        series = series[series >= 0]
-        count = int(series.count())
-        if count == 0:
-            continue
-        mean = float(series.mean())
-        median = float(series.median())
-        p95 = float(series.quantile(0.95))
-        lower_ci, upper_ci = bootstrap_mean_ci(series, cfg.bootstrap_samples, cfg.random_seed, cfg.ci_level)
+    for pos, stage in enumerate(stages):
+        count = int(counts[pos])
+        mean = float(means[pos])
+        median = float(medians[pos])
+        p95 = float(p95s[pos])
+        lower_ci, upper_ci = mean_cis[pos]
 
         throughput = count / window_days if window_days > 0 else float("nan")
         th_ci = poisson_rate_ci(count, window_days, cfg.ci_level)
@@ -210,12 +440,7 @@ def compute_stage_summaries(df: pd.DataFrame, cfg: BaselineConfig, window_days:
         rework_rate = float("nan")
         rework_n = 0
         if rework_flag_col and rework_flag_col in df.columns:
-            flag_series = df[rework_flag_col]
-            if flag_series.dtype == bool:
-                rework_bool = flag_series
-            else:
-                str_vals = flag_series.astype(str).str.lower()
-                rework_bool = str_vals.isin(["true", "1", "yes", "y", "1.0"])
+            rework_bool = rework_flags_to_bool(df[rework_flag_col])
             rework_n = int(rework_bool.sum())
             rework_rate = float(rework_bool.mean())
         summaries[stage] = {
@@ -232,7 +457,7 @@ def compute_stage_summaries(df: pd.DataFrame, cfg: BaselineConfig, window_days:
     return summaries
 
 
-def compute_time_metrics(df: pd.DataFrame, cfg: BaselineConfig) -> Dict[str, Dict[str, Any]]:
+def compute_time_metrics(df: pd.DataFrame, cfg: BaselineConfig, rng: np.random.Generator) -> Dict[str, Dict[str, Any]]:
     time_metrics: Dict[str, Dict[str, Any]] = {}
     if "resolution_time_days" not in df.columns:
         return time_metrics
@@ -243,7 +468,7 @@ def compute_time_metrics(df: pd.DataFrame, cfg: BaselineConfig) -> Dict[str, Dic
         lower_ci, upper_ci = bootstrap_mean_ci(
             resolution,
             cfg.bootstrap_samples,
-            cfg.random_seed,
+            rng,
             cfg.ci_level,
         )
         time_metrics["time_in_system"] = {
@@ -266,7 +491,7 @@ def compute_time_metrics(df: pd.DataFrame, cfg: BaselineConfig) -> Dict[str, Dic
             lower_ci, upper_ci = bootstrap_mean_ci(
                 queue_time,
                 cfg.bootstrap_samples,
-                cfg.random_seed,
+                rng,
                 cfg.ci_level,
             )
             time_metrics["queue_time"] = {
@@ -284,11 +509,11 @@ def load_fit_summary(path: Path) -> Dict[str, Dict[str, Any]]:
     if not path.exists():
         return {}
     df = pd.read_csv(path)
-    rows: Dict[str, Dict[str, Any]] = {}
-    for _, row in df.iterrows():
-        stage = str(row.get("stage")).strip().lower()
-        rows[stage] = row.to_dict()
-    return rows
+    if "stage" not in df.columns:
+        return {}
+    stages = df["stage"].astype(str).str.strip().str.lower().to_numpy()
+    # Later rows win on duplicate stages.
+    return dict(zip(stages, df.to_dict(orient="records")))
 
 
 def build_metrics_vector(
@@ -419,24 +644,15 @@ def collect_metadata(
     state_hashes = {
         "matrix_P": sha256sum(Path(state_paths["matrix_P"])),
         "service_params": sha256sum(Path(state_paths["service_params"])),
-        "stint_pmfs": {Path(p).name: sha256sum(Path(p)) for p in state_paths["stint_pmfs"]},
+        "stint_pmfs": sha256_many([Path(p) for p in state_paths["stint_pmfs"]]),
     }
-    def _replace_nan(obj: Any) -> Any:
-        if isinstance(obj, float) and np.isnan(obj):
-            return None
-        if isinstance(obj, dict):
-            return {k: _replace_nan(v) for k, v in obj.items()}
-        if isinstance(obj, (list, tuple)):
-            return [_replace_nan(v) for v in obj]
-        return obj
-
     meta = {
         "generated_at": datetime.utcnow().isoformat() + "Z",
         "config": dataclasses.asdict(cfg),
         "arrival_info": arrival_info,
-        "stage_info": _replace_nan(stage_info),
-        "time_metrics": _replace_nan(time_metrics),
-        "fit_summary": _replace_nan(fit_rows),
+        "stage_info": stage_info,
+        "time_metrics": time_metrics,
+        "fit_summary": fit_rows,
         "input_hashes": {
             "tickets_prs_merged.csv": sha256sum(cfg.input_csv),
             "fit_summary.csv": sha256sum(cfg.fit_summary_csv),
@@ -448,14 +664,47 @@ def collect_metadata(
     return meta
 
 
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+def _replace_nan(obj: Any) -> Any:
+    if isinstance(obj, float) and np.isnan(obj):
+        return None
+    if isinstance(obj, dict):
+        return {k: _replace_nan(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_nan(v) for v in obj]
+    return obj
+
+
+def write_metadata_json(path: Path, metadata: Dict[str, Any]) -> None:
+    """Serialize metadata with NaN written as null.
+
+    orjson emits NaN as null natively, so the recursive scrub only runs on
+    the stdlib ``json`` fallback.
+    """
+
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        path.write_bytes(orjson.dumps(metadata, default=_json_default, option=options))
+        return
+    path.write_text(json.dumps(_replace_nan(metadata), indent=2, default=str))
+
+
 def run(config_path: Path) -> None:
     cfg = BaselineConfig.from_file(config_path)
-    np.random.seed(cfg.random_seed)
 
-    df = pd.read_csv(cfg.input_csv)
+    # Independent bootstrap substreams for stage and time metrics, so adding or
+    # dropping a stage column does not shift the time-metric CIs (and vice versa).
+    stage_seed, time_seed = np.random.SeedSequence(cfg.random_seed).spawn(2)
+
+    df = load_input(cfg)
     arrival_info = compute_arrival_and_closure(df, cfg)
-    stage_info = compute_stage_summaries(df, cfg, arrival_info["window_days"])
-    time_metrics = compute_time_metrics(df, cfg)
+    stage_info = compute_stage_summaries(df, cfg, arrival_info["window_days"], np.random.default_rng(stage_seed))
+    time_metrics = compute_time_metrics(df, cfg, np.random.default_rng(time_seed))
     fit_rows = load_fit_summary(cfg.fit_summary_csv)
 
     metrics_df = build_metrics_vector(arrival_info, stage_info, time_metrics)
@@ -464,7 +713,7 @@ def run(config_path: Path) -> None:
 
     metadata = collect_metadata(cfg, arrival_info, stage_info, time_metrics, fit_rows)
     cfg.output_metadata_json.parent.mkdir(parents=True, exist_ok=True)
-    cfg.output_metadata_json.write_text(json.dumps(metadata, indent=2, default=str))
+    write_metadata_json(cfg.output_metadata_json, metadata)
 
     print(metrics_df.to_string(index=False))
     print(f"\nSaved metrics to {cfg.output_metrics_csv} and metadata to {cfg.output_metadata_json}")